@@ -1,29 +1,64 @@
 import os
+import subprocess
+import sys
 import glob
-from os.path import join, dirname, basename
+from os.path import join, dirname, basename, exists, getmtime, splitext
 
 
-def generatePyFromUi(verbose=True):
+def removeConnectSlotsByName(filename):
+    """
+    Removes the connectSlotsByName call from a generated .py file. All signals
+    are connected explicitly in the widgets, so the lookup of slots by
+    name for every child widget is never needed.
+    """
+    with open(filename) as f:
+        lines = f.readlines()
+
+    with open(filename, "w") as f:
+        f.writelines(
+            line
+            for line in lines
+            if "QMetaObject.connectSlotsByName" not in line
+        )
+
+
+def generatePyFromUi(verbose=True, force=False):
     """
     Convert .ui files to .py files after editing, so they can be imported in
-    Python
+    Python. Only .ui files that are newer than their generated .py file are
+    converted, unless force is True.
     """
     ui_files = glob.glob("**/*.ui", recursive=True)
 
     for filename in ui_files:
         if os.path.exists(filename):
-            out_name = join(dirname(filename), "_" + basename(filename)).rstrip(
-                ".ui"
+            out_name = join(
+                dirname(filename), "_" + splitext(basename(filename))[0]
             )
 
+            if (
+                not force
+                and exists(out_name + ".py")
+                and getmtime(out_name + ".py") >= getmtime(filename)
+            ):
+                continue
+
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "PyQt5.uic.pyuic",
+                    filename,
+                    "-o",
+                    out_name + ".py",
+                    "-x",
+                ],
+                check=True,
+            )
+            removeConnectSlotsByName(out_name + ".py")
             if verbose:
                 print("{} was converted".format(filename))
-            os.system(
-                "exec python3 -m PyQt5.uic.pyuic {0} -o {1}.py -x".format(
-                    filename, out_name
-                )
-            )
 
 
 if __name__ == "__main__":
-    generatePyFromUi()
+    generatePyFromUi(force="--force" in sys.argv)
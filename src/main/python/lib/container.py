@@ -1,3 +1,4 @@
+import itertools
 import multiprocessing
 import os.path
 import time
@@ -128,6 +129,10 @@ class TraceContainer:
     Class for storing individual trace information.
     """
 
+    # Numbers traces in the order they're created, which is also the order
+    # they're added to DataContainer.traces
+    _load_counter = itertools.count()
+
     # TODO: make these names switchable depending on global vars and model config
     ml_column_names = [
         "p_bleached",
@@ -160,6 +165,7 @@ class TraceContainer:
         self.load_successful = False
 
         self.is_checked = False  # type: bool
+        self.load_index = next(TraceContainer._load_counter)  # type: int
         self.xdata = []  # type: [int, int]
 
         self.grn = TraceChannel(color="green")
@@ -689,10 +695,36 @@ class DataContainer:
         self.simulated_traces = {}
         self.videos = {}
         self.traces = {}
+        self.checked_traces = {}
         self.currName = None
         self.histData = HistogramData()
         self.tdpData = TDPData()
 
+    def set_checked(self, trace: TraceContainer, checked: bool):
+        """
+        Checks or unchecks a trace, and keeps track of the checked traces so
+        that they can be retrieved without looping over all traces.
+        """
+        trace.is_checked = checked
+        if checked:
+            self.checked_traces[trace.name] = trace
+        else:
+            self.checked_traces.pop(trace.name, None)
+
+    def get_checked_traces(self) -> List[TraceContainer]:
+        """
+        Returns the checked traces, in the same order as in traces. Traces
+        that have since been deleted or replaced are dropped.
+        """
+        self.checked_traces = {
+            name: trace
+            for name, trace in self.checked_traces.items()
+            if trace.is_checked and self.traces.get(name) is trace
+        }
+        return sorted(
+            self.checked_traces.values(), key=lambda trace: trace.load_index
+        )
+
     def get(self, name) -> VideoContainer:
         """Shortcut to return the metadata of selected video."""
         if self.currName is not None:
@@ -168,6 +168,86 @@ def drop_bleached_frames(
     return E_trace_, S_trace_
 
 
+def unbleached_intensities(
+    intensities,
+    bleaches,
+    end_frame=None,
+    max_frames=None,
+    blink_intervals=None,
+) -> Tuple[np.ndarray, ...]:
+    """
+    Returns the DD, DA and AA intensities of a single trace for the frames used
+    for E and S (as drop_bleached_frames), along with DD and DA up to
+    end_frame (as exclude_blink_intervals), and whether AA is complete.
+    No correction factors are applied, so that the intensities of many traces
+    can be pooled and corrected at once with pooled_ES.
+    """
+    _, I_DD, I_DA, I_AA = correct_DA(intensities)
+
+    bleach = min_real(bleaches)
+    if bleach is None:
+        bleach = len(I_DD)
+    if end_frame is None:
+        end_frame = len(I_DD)
+
+    keep = np.ones(len(I_DD), dtype=bool)
+    if blink_intervals:
+        for start, end in blink_intervals:
+            if end is None:
+                continue
+            keep[start:end] = False
+
+    es_keep = keep[:bleach][:max_frames]
+    n = len(es_keep)
+    I_DD_es, I_DA_es, I_AA_es = (
+        arr[:n][es_keep] for arr in (I_DD, I_DA, I_AA)
+    )
+
+    # Usually the same frames, in which case the arrays are shared
+    dd_keep = keep[:end_frame]
+    if len(dd_keep) == n:
+        DD, DA = I_DD_es, I_DA_es
+    else:
+        DD, DA = I_DD[: len(dd_keep)][dd_keep], I_DA[: len(dd_keep)][dd_keep]
+
+    return I_DD_es, I_DA_es, I_AA_es, DD, DA, not contains_nan(I_AA)
+
+
+def pooled_ES(
+    I_DD,
+    I_DA,
+    I_AA,
+    alpha=0,
+    delta=0,
+    beta=1,
+    gamma=1,
+    has_AA=None,
+    clip_range=(-0.3, 1.3),
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates corrected E and S in a single vectorized pass, from intensities
+    pooled from many traces. As in correct_DA, the delta correction is only
+    applied to frames from traces with a complete AA channel, given by the
+    boolean has_AA (all frames if None).
+    """
+    cmin, cmax = clip_range
+
+    if has_AA is None:
+        F_DA = I_DA - (alpha * I_DD) - (delta * I_AA)
+    else:
+        F_DA = I_DA - (alpha * I_DD) - (delta * np.where(has_AA, I_AA, 0))
+    F_DD = gamma * I_DD
+    F_AA = (1 / beta) * I_AA
+
+    E = F_DA / (F_DA + F_DD)
+    S = (F_DD + F_DA) / (F_DD + F_DA + F_AA)
+
+    E = np.clip(E, cmin, cmax, out=E)
+    S = np.clip(S, cmin, cmax, out=S)
+
+    return E, S
+
+
 def exclude_blink_intervals(array: np.ndarray, intervals: Optional[List[Tuple[int, int]]]):
     """Return a copy of ``array`` without the regions specified in ``intervals``."""
 
@@ -241,11 +321,11 @@ def beta_gamma_factor(E_app, S_app):
     return beta, gamma
 
 
-def trim_ES(E: list, S: list):
+def trim_ES(E: np.ndarray, S: np.ndarray):
     """
     Trims out-of-range values of E/S values
     """
-    E, S = np.array(E), np.array(S)
+    E, S = np.asarray(E), np.asarray(S)
     if contains_nan(S):
         # Use E only
         E = E[(E > -0.3) & (E < 1.3)]  # original line
@@ -564,6 +644,40 @@ def min_real(ls) -> Union[Union[int, float], None]:
     return None if len(ls) == 0 else min(ls)
 
 
+def kde_grid(
+    xdata, ydata, resolution=100, extend_grid=1, diagonal: bool = False
+):
+    """
+    Creates the (x, y) grid on which contour_2d evaluates the 2D KDE. The grid
+    only depends on the data extent and resolution, so it can be reused for
+    e.g. different bandwidths
+    """
+    # Stretch the min/max values to make sure that the KDE goes beyond the
+    # outermost points
+    meanx = np.mean(xdata) * extend_grid
+    meany = np.mean(ydata) * extend_grid
+
+    if diagonal:
+        vmin = min(np.min(xdata), np.min(ydata))
+        vmax = max(np.max(xdata), np.max(ydata))
+
+        mean = np.mean(np.concatenate([xdata, ydata])) * extend_grid
+
+        x, y = np.mgrid[
+            vmin - mean : vmax + mean : complex(resolution),
+            vmin - mean : vmax + mean : complex(resolution),
+        ]
+    else:
+        xmin, xmax = np.min(xdata), np.max(xdata)
+        ymin, ymax = np.min(ydata), np.max(ydata)
+
+        x, y = np.mgrid[
+            xmin - meanx : xmax + meanx : complex(resolution),
+            ymin - meany : ymax + meany : complex(resolution),
+        ]
+    return x, y
+
+
 def contour_2d(
     xdata,
     ydata,
@@ -575,6 +689,7 @@ def contour_2d(
     resolution=100,
     cbins="auto",
     diagonal: bool = False,
+    grid=None,
 ):
     """
     Calculates the 2D kernel density estimate for a dataset.
@@ -595,6 +710,9 @@ def contour_2d(
     c = ax.contourf(*contour)
 
     For optional colorbar, add fig.colorbar(c)
+
+    A precomputed (x, y) grid from kde_grid can be passed as grid, in which
+    case resolution, extend_grid and diagonal are ignored.
     """
 
     if kernel.startswith("epa"):
@@ -603,36 +721,25 @@ def contour_2d(
     if bandwidth == "auto":
         bandwidth = (len(xdata) * 4 / 4.0) ** (-1.0 / 6)
 
-    # Stretch the min/max values to make sure that the KDE goes beyond the
-    # outermost points
-    meanx = np.mean(xdata) * extend_grid
-    meany = np.mean(ydata) * extend_grid
-
     # Create a grid for KDE
-    if diagonal:
-        vmin = min(min(xdata), min(ydata))
-        vmax = max(max(xdata), max(ydata))
-
-        mean = np.mean(np.concatenate([xdata, ydata])) * extend_grid
-
-        x, y = np.mgrid[
-            vmin - mean : vmax + mean : complex(resolution),
-            vmin - mean : vmax + mean : complex(resolution),
-        ]
-    else:
-        x, y = np.mgrid[
-            min(xdata) - meanx : max(xdata) + meanx : complex(resolution),
-            min(ydata) - meany : max(ydata) + meany : complex(resolution),
-        ]
+    if grid is None:
+        grid = kde_grid(
+            xdata,
+            ydata,
+            resolution=resolution,
+            extend_grid=extend_grid,
+            diagonal=diagonal,
+        )
+    x, y = grid
 
-    positions = np.vstack([x.ravel(), y.ravel()])
-    values = np.vstack([xdata, ydata])
+    positions = np.column_stack([x.ravel(), y.ravel()])
+    values = np.column_stack([xdata, ydata])
 
     # Define KDE with specified bandwidth
     kernel_sk = sklearn.neighbors.KernelDensity(
         kernel=kernel, bandwidth=bandwidth
-    ).fit(list(zip(*values)))
-    z = np.exp(kernel_sk.score_samples(list(zip(*positions))))
+    ).fit(values)
+    z = np.exp(kernel_sk.score_samples(positions))
 
     z = np.reshape(z.T, x.shape)
 
@@ -312,6 +312,25 @@ def get_colors(cmap, n_colors):
     return [plt.get_cmap(cmap)(norm(i)) for i in range(n_colors)]
 
 
+def histogram_step_xy(data, bins, orientation="vertical"):
+    """
+    Returns the outline of a normalized, stepfilled histogram as an (N, 2)
+    array of vertices, to update an existing Polygon with set_xy instead of
+    re-creating the patches with ax.hist
+    """
+    if data is None or len(data) == 0:
+        return np.empty((0, 2))
+
+    counts, edges = np.histogram(data, bins=bins, density=True)
+    x = np.repeat(edges, 2)
+    y = np.concatenate(([0], np.repeat(counts, 2), [0]))
+
+    if orientation == "horizontal":
+        x, y = y, x
+
+    return np.column_stack((x, y))
+
+
 def plot_gaussian(mean, sigma, ax, x, weight=1, color=None):
     """
     Plots a single gaussian and returns the provided ax, along with computed
@@ -172,8 +172,8 @@ if __name__ == "__main__":
     _TransitionDensityWindow = TransitionDensityWindow()
     _SimulatorWindow = SimulatorWindow()
 
-    # Inspector sheets
-    _HistogramInspector = DensityWindowInspector(_HistogramWindow)
+    # Inspector sheets. The HistogramWindow creates its DensityWindowInspector
+    # when it's first opened
     _TransitionDensityInspector = DensityWindowInspector(
         _TransitionDensityWindow
     )
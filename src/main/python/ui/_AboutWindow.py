@@ -75,7 +75,6 @@ class Ui_About(object):
         self.verticalLayout_2.addLayout(self.verticalLayout)
 
         self.retranslateUi(About)
-        QtCore.QMetaObject.connectSlotsByName(About)
 
     def retranslateUi(self, About):
         _translate = QtCore.QCoreApplication.translate
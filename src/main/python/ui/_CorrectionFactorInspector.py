@@ -88,7 +88,6 @@ class Ui_CorrectionFactorInspector(object):
         self.gridLayout_2.addLayout(self.gridLayout, 0, 0, 1, 1)
 
         self.retranslateUi(CorrectionFactorInspector)
-        QtCore.QMetaObject.connectSlotsByName(CorrectionFactorInspector)
 
     def retranslateUi(self, CorrectionFactorInspector):
         _translate = QtCore.QCoreApplication.translate
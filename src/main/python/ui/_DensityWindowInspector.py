@@ -132,7 +132,6 @@ class Ui_DensityWindowInspector(object):
         self.gridLayout.addLayout(self.gridLayout_2, 4, 0, 1, 1)
 
         self.retranslateUi(DensityWindowInspector)
-        QtCore.QMetaObject.connectSlotsByName(DensityWindowInspector)
 
     def retranslateUi(self, DensityWindowInspector):
         _translate = QtCore.QCoreApplication.translate
@@ -159,22 +158,6 @@ class Ui_DensityWindowInspector(object):
         self.sColorLabel.setText(_translate("DensityWindowInspector", "S Color:"))
         self.cmapLabel.setText(_translate("DensityWindowInspector", "Colormap:"))
 
-        for name in [
-            "orange",
-            "purple",
-            "blue",
-            "green",
-            "red",
-            "cyan",
-            "yellow",
-            "grey",
-        ]:
-            self.eColorComboBox.addItem(name)
-            self.sColorComboBox.addItem(name)
-
-        for cm in ["plasma", "viridis", "inferno", "magma", "cividis"]:
-            self.cmapComboBox.addItem(cm)
-
 
 if __name__ == "__main__":
     import sys
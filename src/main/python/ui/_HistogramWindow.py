@@ -94,7 +94,6 @@ class Ui_HistogramWindow(object):
         HistogramWindow.setCentralWidget(self.centralWidget)
 
         self.retranslateUi(HistogramWindow)
-        QtCore.QMetaObject.connectSlotsByName(HistogramWindow)
 
     def retranslateUi(self, HistogramWindow):
         _translate = QtCore.QCoreApplication.translate
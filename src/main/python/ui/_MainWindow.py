@@ -335,7 +335,6 @@ class Ui_MainWindow(object):
         MainWindow.setCentralWidget(self.centralWidget)
 
         self.retranslateUi(MainWindow)
-        QtCore.QMetaObject.connectSlotsByName(MainWindow)
         MainWindow.setTabOrder(self.contrastBoxLoGreen, self.contrastBoxHiGreen)
         MainWindow.setTabOrder(self.contrastBoxHiGreen, self.contrastBoxLoRed)
         MainWindow.setTabOrder(self.contrastBoxLoRed, self.contrastBoxHiRed)
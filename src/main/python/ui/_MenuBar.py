@@ -342,7 +342,6 @@ class Ui_MenuBar(object):
         self.menuBar.addAction(self.menuHelp.menuAction())
 
         self.retranslateUi(MenuBar)
-        QtCore.QMetaObject.connectSlotsByName(MenuBar)
 
     def retranslateUi(self, MenuBar):
         _translate = QtCore.QCoreApplication.translate
@@ -240,7 +240,6 @@ class Ui_Preferences(object):
         self.verticalLayout.addWidget(self.groupBox_2)
 
         self.retranslateUi(Preferences)
-        QtCore.QMetaObject.connectSlotsByName(Preferences)
         Preferences.setTabOrder(
             self.checkBox_batchLoadingMode, self.checkBox_unColocRed
         )
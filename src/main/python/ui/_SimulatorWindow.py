@@ -953,7 +953,6 @@ class Ui_SimulatorWindow(object):
         SimulatorWindow.setCentralWidget(self.centralWidget)
 
         self.retranslateUi(SimulatorWindow)
-        QtCore.QMetaObject.connectSlotsByName(SimulatorWindow)
         SimulatorWindow.setTabOrder(
             self.inputTraceLength, self.inputAggregateProbability
         )
@@ -43,7 +43,6 @@ class Ui_TraceWindow(object):
         TraceWindow.setCentralWidget(self.centralWidget)
 
         self.retranslateUi(TraceWindow)
-        QtCore.QMetaObject.connectSlotsByName(TraceWindow)
 
     def retranslateUi(self, TraceWindow):
         _translate = QtCore.QCoreApplication.translate
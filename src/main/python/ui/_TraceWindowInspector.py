@@ -125,7 +125,6 @@ class Ui_TraceWindowInspector(object):
         self.gridLayout.addLayout(self.gridLayout_2, 4, 0, 1, 1)
 
         self.retranslateUi(TraceWindowInspector)
-        QtCore.QMetaObject.connectSlotsByName(TraceWindowInspector)
         TraceWindowInspector.setTabOrder(self.spinBoxStoiLo, self.spinBoxStoiHi)
         TraceWindowInspector.setTabOrder(self.spinBoxStoiHi, self.spinBoxFretLo)
         TraceWindowInspector.setTabOrder(self.spinBoxFretLo, self.spinBoxFretHi)
@@ -78,7 +78,6 @@ class Ui_TransitionDensityWindow(object):
         TransitionDensityWindow.setCentralWidget(self.centralWidget)
 
         self.retranslateUi(TransitionDensityWindow)
-        QtCore.QMetaObject.connectSlotsByName(TransitionDensityWindow)
 
     def retranslateUi(self, TransitionDensityWindow):
         _translate = QtCore.QCoreApplication.translate
@@ -441,7 +441,7 @@ class BaseWindow(QMainWindow):
             item = self.listModel.item(index)
             item.setCheckState(Qt.Unchecked)
             trace = self.getTrace(item)
-            trace.is_checked = False
+            self.data.set_checked(trace, False)
 
         histogram_window = self.windows[gvars.HistogramWindow]
         transition_density_window = self.windows[gvars.HistogramWindow]
@@ -460,7 +460,7 @@ class BaseWindow(QMainWindow):
             item = self.listModel.item(index)
             item.setCheckState(Qt.Checked)
             trace = self.getTrace(item)
-            trace.is_checked = True
+            self.data.set_checked(trace, True)
 
         histogram_window = self.windows[gvars.HistogramWindow]
         transition_density_window = self.windows[gvars.HistogramWindow]
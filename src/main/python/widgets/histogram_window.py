@@ -1,7 +1,8 @@
+import io
 from functools import partial
 
 import numpy as np
-import pandas as pd
+from matplotlib.patches import Polygon
 from PyQt5.QtWidgets import QFileDialog
 
 import lib.math
@@ -11,6 +12,7 @@ from global_variables import GlobalVariables as gvars
 from ui._HistogramWindow import Ui_HistogramWindow
 from ui._MenuBar import Ui_MenuBar
 from widgets.base_window import BaseWindow
+from widgets.inspectors import DensityWindowInspector
 
 
 class HistogramWindow(BaseWindow):
@@ -34,6 +36,39 @@ class HistogramWindow(BaseWindow):
         self.n_points = None
         self.len = None
 
+        # Per-trace results from getHistogramData, reused between refreshes
+        self._trace_cache = {}
+        self._trace_cache_prev = {}
+
+        # KDE grids by (resolution, corrected), valid until the data changes
+        self._kde_grid_cache = {}
+
+        # DensityWindowInspector values, read from the config (which re-reads
+        # the file) only until the inspector is opened
+        self._density_params = None
+
+        # Overlaid scatter points, updated in place by replotOverlay
+        self._overlay_pts = None
+
+        # Center plot artists. Texts and the guide line are persistent, while
+        # contours and gaussian fit texts are replaced on every plot
+        self._ctr_contour = None
+        self._ctr_n_text = None
+        self._ctr_factor_texts = []
+        self._ctr_gauss_texts = []
+        self._ctr_hline = None
+
+        # Marginal histograms and gaussian fits, updated in place by plotTop
+        # and plotRight
+        self._top_fill = None
+        self._rgt_fill = None
+        self._gauss_lines = []
+        # Gaussian parameters the current fit lines were plotted for
+        self._gauss_key = None
+
+        # Figure background without the center plot artists, for blitting
+        self._backgrounds = {}
+
         # Plotting parameters
         self.marg_bins = np.arange(-0.1, 1.1, 0.02)
         self.xpts = np.linspace(-0.1, 1.1, 300)
@@ -66,7 +101,17 @@ class HistogramWindow(BaseWindow):
         Opens the inspector (modal) window to format the current plot
         """
         if self.isActiveWindow():
-            self.inspectors[gvars.DensityWindowInspector].show()
+            self.getDensityWindowInspector().show()
+
+    def getDensityWindowInspector(self) -> DensityWindowInspector:
+        """
+        Returns the inspector. It's only created the first time it's opened,
+        until then the plot settings are read directly from the config.
+        """
+        if gvars.DensityWindowInspector not in self.inspectors:
+            # Adds itself to self.inspectors
+            DensityWindowInspector(self)
+        return self.inspectors[gvars.DensityWindowInspector]
 
     def exportHistogramData(self):
         """
@@ -81,27 +126,29 @@ class HistogramWindow(BaseWindow):
             self, directory=directory
         )  # type: str, str
 
-        self.getHistogramData()
-
         if path != "":
             if not path.split("/")[-1].endswith(".txt"):
                 path += ".txt"
 
+            # Always recalculated, as traces can change without the window
+            # knowing. Unchanged traces are taken from the per-trace cache
+            self.getHistogramData()
+
             # Exports all the currently plotted datapoints
             if self.ui.applyCorrectionsCheckBox.isChecked():
                 E, S = self.E, self.S
             else:
                 E, S = self.E_un, self.S_un
 
-            if E is not None:
-                if np.all(np.isnan(S)):  # Exports Non-ALEX data
-                    df = pd.DataFrame({"E": E}).round(4)
-                else:
-                    df = pd.DataFrame({"E": E, "S": S}).round(
-                        4
-                    )  # Exports ALEX data
-            else:
-                df = pd.DataFrame({"E": [], "S": []})
+            if E is None:
+                header, arr = "E\tS", np.empty((0, 2))
+            elif S is None or np.all(np.isnan(S)):  # Exports Non-ALEX data
+                header, arr = "E", np.column_stack([E])
+            else:  # Exports ALEX data
+                header, arr = "E\tS", np.column_stack([E, S])
+
+            values = io.StringIO()
+            np.savetxt(values, arr, fmt="%.4f", delimiter="\t")
 
             ntraces_txt = "N_traces: {}".format(self.n_samples)
 
@@ -110,11 +157,13 @@ class HistogramWindow(BaseWindow):
                     "{0}\n"
                     "{1}\n"
                     "{2}\n\n"
-                    "{3}".format(
+                    "{3}\n"
+                    "{4}".format(
                         exp_txt,
                         date_txt,
                         ntraces_txt,
-                        df.to_csv(index=False, sep="\t", na_rep="NaN"),
+                        header,
+                        values.getvalue().replace("nan", "NaN"),
                     )
                 )
 
@@ -136,20 +185,13 @@ class HistogramWindow(BaseWindow):
             self.refreshPlot()
 
     def connectUi(self):
-        for f in (
-            partial(self.fitGaussians, "auto"),
-            partial(self.refreshPlot, True),
-        ):
-            self.ui.gaussianAutoButton.clicked.connect(f)
-
-        for f in (self.fitGaussians,):
-            self.ui.gaussianSpinBox.valueChanged.connect(f)
-
-        for f in (self.fitGaussians,):
-            self.ui.applyCorrectionsCheckBox.clicked.connect(f)
-
-        for f in (self.fitGaussians,):
-            self.ui.framesSpinBox.valueChanged.connect(f)
+        # fitGaussians refreshes the plot itself
+        self.ui.gaussianAutoButton.clicked.connect(
+            partial(self.fitGaussians, "auto")
+        )
+        self.ui.gaussianSpinBox.valueChanged.connect(self.fitGaussians)
+        self.ui.applyCorrectionsCheckBox.clicked.connect(self.fitGaussians)
+        self.ui.framesSpinBox.valueChanged.connect(self.fitGaussians)
 
     def savePlot(self):
         """
@@ -173,11 +215,47 @@ class HistogramWindow(BaseWindow):
                 spine.set_linewidth(0.5)
             ax.tick_params(axis="both", colors=gvars.color_gui_text, width=0.5)
 
+        # The marginal histograms are persistent patches, whose outlines are
+        # updated on every refresh
+        self._top_fill = Polygon(np.empty((0, 2)), alpha=0.8, lw=0)
+        self._rgt_fill = Polygon(np.empty((0, 2)), alpha=0.8, lw=0)
+        self._top_fill.sticky_edges.y.append(0)
+        self._rgt_fill.sticky_edges.x.append(0)
+        self.canvas.ax_top.add_patch(self._top_fill)
+        self.canvas.ax_rgt.add_patch(self._rgt_fill)
+
+        # Texts are updated with set_text by plotCenter. Everything in the
+        # center plot is drawn on top of a cached background (animated), so
+        # that it can be updated without a full redraw
+        ax = self.canvas.ax_ctr
+        self._ctr_n_text = ax.text(
+            x=0, y=0.9, s="", color=gvars.color_gui_text, animated=True
+        )
+        self._ctr_factor_texts = [
+            ax.text(
+                x=0.0,
+                y=0.15 - 0.05 * n,
+                s="",
+                color=gvars.color_gui_text,
+                zorder=10,
+                animated=True,
+            )
+            for n in range(4)
+        ]
+        self._ctr_hline = ax.axhline(
+            0.5, color="black", alpha=0.3, lw=0.5, ls="--", zorder=2
+        )
+        self._ctr_hline.set_animated(True)
+        self.clearCenter()
+
+        self.canvas.mpl_connect("draw_event", self._onDraw)
+        self.canvas.mpl_connect("resize_event", self._invalidateBackground)
+
     def getHistogramData(self, n_first_frames="all"):
         """
         Returns pooled E and S_app data before bleaching, for each trace.
-        The loops take approx. 0.1 ms per trace, and it's too much trouble
-        to lower it further.
+        The unbleached intensities are cached per trace, and the correction
+        factors are applied to the pooled intensities of all traces at once.
         Also return DD, DA, and Pearson correlation data.
         """
         if n_first_frames == "all":
@@ -206,9 +284,7 @@ class HistogramWindow(BaseWindow):
             self.S_un,
         ) = self.none_
 
-        checkedTraces = [
-            trace for trace in self.data.traces.values() if trace.is_checked
-        ]
+        checkedTraces = self.data.get_checked_traces()
 
         self.len = len(checkedTraces)
         self.n_samples = self.len
@@ -216,40 +292,32 @@ class HistogramWindow(BaseWindow):
         alpha = self.getConfig(gvars.key_alphaFactor)
         delta = self.getConfig(gvars.key_deltaFactor)
 
-        DA, DD, E_app, S_app, lengths, corrs = [], [], [], [], [], []
-        for trace in checkedTraces:
-            E, S = lib.math.drop_bleached_frames(
-                intensities=trace.get_intensities(),
-                bleaches=trace.get_bleaches(),
-                alpha=alpha,
-                delta=delta,
-                max_frames=n_first_frames,
-                blink_intervals=trace.blink_intervals,
-            )
-            E_app.extend(E)
-            S_app.extend(S)
-            _, I_DD, I_DA, I_AA = lib.math.correct_DA(trace.get_intensities())
-            trace.calculate_stoi()
-
-            end_frame = trace.first_bleach
-            if end_frame is None:
-                end_frame = len(I_DD)
+        # Results still in use are moved back into the cache as they're hit
+        self._trace_cache_prev, self._trace_cache = self._trace_cache, {}
 
-            I_DD = lib.math.exclude_blink_intervals(
-                I_DD[: end_frame], trace.blink_intervals
-            )
-            I_DA = lib.math.exclude_blink_intervals(
-                I_DA[: end_frame], trace.blink_intervals
+        # Intensities of all checked traces are pooled, so that the correction
+        # factors can be applied to all of them at once
+        results = [
+            self._compute_trace_intensities(trace, n_first_frames)
+            for trace in checkedTraces
+        ]
+        if len(results) > 0:
+            I_DD, I_DA, I_AA, DD, DA = (
+                np.concatenate([r[i] for r in results]) for i in range(5)
             )
+        else:
+            I_DD, I_DA, I_AA, DD, DA = (np.array([]) for _ in range(5))
+        # DD and DA are only stored, so they're kept in single precision. E and
+        # S stay in double precision, which the KDE and GMM fits work in
+        self.DD, self.DA = DD.astype(np.float32), DA.astype(np.float32)
+        has_AA = np.repeat(
+            np.array([r[5] for r in results], dtype=bool),
+            [len(r[0]) for r in results],
+        )
 
-            DD.append(I_DD)
-            DA.append(I_DA)
-            _len = len(E)
-            lengths.append(_len)
-            self.n_points += _len
-
-        self.DD = np.concatenate(DD).flatten() if len(DD) > 0 else np.array([])
-        self.DA = np.concatenate(DA).flatten() if len(DA) > 0 else np.array([])
+        E_app, S_app = lib.math.pooled_ES(
+            I_DD, I_DA, I_AA, alpha=alpha, delta=delta, has_AA=has_AA
+        )
 
         self.E_un, self.S_un = lib.math.trim_ES(E_app, S_app)
         self.n_points = len(self.E_un)
@@ -262,20 +330,16 @@ class HistogramWindow(BaseWindow):
                 beta, gamma = lib.math.beta_gamma_factor(
                     E_app=self.E_un, S_app=self.S_un
                 )
-                E_real, S_real, = [], []
-                for trace in checkedTraces:
-                    E, S = lib.math.drop_bleached_frames(
-                        intensities=trace.get_intensities(),
-                        bleaches=trace.get_bleaches(),
-                        alpha=alpha,
-                        delta=delta,
-                        beta=beta,
-                        gamma=gamma,
-                        max_frames=n_first_frames,
-                        blink_intervals=trace.blink_intervals,
-                    )
-                    E_real.extend(E)
-                    S_real.extend(S)
+                E_real, S_real = lib.math.pooled_ES(
+                    I_DD,
+                    I_DA,
+                    I_AA,
+                    alpha=alpha,
+                    delta=delta,
+                    beta=beta,
+                    gamma=gamma,
+                    has_AA=has_AA,
+                )
                 self.E, self.S = lib.math.trim_ES(E_real, S_real)
                 self.beta = beta
                 self.gamma = gamma
@@ -285,6 +349,49 @@ class HistogramWindow(BaseWindow):
         self.alpha = alpha
         self.delta = delta
 
+        # Drop results for traces that are no longer checked or have changed
+        self._trace_cache_prev = {}
+        self._kde_grid_cache = {}
+
+    def _compute_trace_intensities(self, trace, n_first_frames):
+        """
+        Returns the unbleached intensities of a single trace, as given by
+        lib.math.unbleached_intensities. Results are cached by the trace
+        bleaching/blinking state, and are only recomputed if this (or the
+        intensities) have changed.
+        """
+        key = (
+            id(trace),
+            trace.get_bleaches(),
+            trace.first_bleach,
+            tuple(tuple(interval) for interval in trace.blink_intervals),
+            n_first_frames,
+        )
+        channels = tuple(
+            arr
+            for c in (trace.grn, trace.acc, trace.red)
+            for arr in (c.int, c.bg)
+        )
+
+        cached = self._trace_cache.get(key) or self._trace_cache_prev.get(key)
+        if cached is not None and all(
+            a is b for a, b in zip(cached[0], channels)
+        ):
+            self._trace_cache[key] = cached
+            return cached[1]
+
+        # Same order as trace.get_intensities(), but without copying, as the
+        # intensities are only read here
+        result = lib.math.unbleached_intensities(
+            intensities=channels,
+            bleaches=trace.get_bleaches(),
+            end_frame=trace.first_bleach,
+            max_frames=n_first_frames,
+            blink_intervals=trace.blink_intervals,
+        )
+        self._trace_cache[key] = channels, result
+        return result
+
     def fitGaussians(self, states):
         """
         Fits multiple gaussians to the E data
@@ -319,51 +426,63 @@ class HistogramWindow(BaseWindow):
         Re-plot non-persistent plot settings (otherwise will be overwritten
         by ax.clear())
         """
-        self.canvas.ax_ctr.set_xlim(-0.1, 1.1)
-        self.canvas.ax_ctr.set_ylim(-0.1, 1.1)
+        canvas = self.canvas
+
+        canvas.ax_ctr.set_xlim(-0.1, 1.1)
+        canvas.ax_ctr.set_ylim(-0.1, 1.1)
 
-        for ax in self.canvas.axes_marg:
+        for ax in canvas.axes_marg:
             for tk in ax.get_xticklabels():
                 tk.set_visible(False)
             for tk in ax.get_yticklabels():
                 tk.set_visible(False)
 
-        self.canvas.ax_top.set_xlabel(r"$\mathbf{E}_{FRET}$")
-        self.canvas.ax_top.xaxis.set_label_position("top")
+        canvas.ax_top.set_xlabel(r"$\mathbf{E}_{FRET}$")
+        canvas.ax_top.xaxis.set_label_position("top")
 
-        self.canvas.ax_rgt.set_ylabel(r"$\mathbf{S}$")
-        self.canvas.ax_rgt.yaxis.set_label_position("right")
+        canvas.ax_rgt.set_ylabel(r"$\mathbf{S}$")
+        canvas.ax_rgt.yaxis.set_label_position("right")
 
     def plotTop(self, corrected, color=None):
         """
         Plots the top left top marginal histogram (E).
         """
         E = self.E if corrected else self.E_un
+        ax = self.canvas.ax_top
 
-        if E is not None:
-            self.canvas.ax_top.clear()
-            self.canvas.ax_top.hist(
-                E,
-                bins=self.marg_bins,
-                color=color or gvars.color_orange,
-                alpha=0.8,
-                density=True,
-                histtype="stepfilled",
-            )
+        self._top_fill.set_facecolor(color or gvars.color_orange)
+        self._top_fill.set_xy(
+            lib.plotting.histogram_step_xy(E, bins=self.marg_bins)
+        )
 
-        if self.gauss_params is not None:
+        # The fitted gaussians are only replotted if the fit has changed
+        gauss_params = self.gauss_params
+        gauss_key = (
+            None
+            if gauss_params is None
+            else tuple(tuple(map(float, p)) for p in gauss_params)
+        )
+        if gauss_key != self._gauss_key:
+            self.removeGaussianLines()
+            self._gauss_key = gauss_key
+
+        if gauss_params is not None and not self._gauss_lines:
+            n_lines = len(ax.lines)
             joint_dist = []
             xpts = self.xpts
-            for (m, s, w) in self.gauss_params:
+            # The axes aren't cleared, so the color cycle is reset to draw the
+            # components as C0, C1, ... on every fit
+            ax.set_prop_cycle(None)
+            for (m, s, w) in gauss_params:
                 _, y = lib.plotting.plot_gaussian(
-                    mean=m, sigma=s, weight=w, x=xpts, ax=self.canvas.ax_top
+                    mean=m, sigma=s, weight=w, x=xpts, ax=ax
                 )
                 joint_dist.append(y)
 
             # Sum of all gaussians (joint distribution)
             joint_dist = np.sum(joint_dist, axis=0)
 
-            self.canvas.ax_top.plot(
+            ax.plot(
                 xpts,
                 joint_dist,
                 color=gvars.color_grey,
@@ -371,32 +490,69 @@ class HistogramWindow(BaseWindow):
                 zorder=10,
                 ls="--",
             )
+            self._gauss_lines = ax.lines[n_lines:]
+
+        ax.set_xlim(-0.1, 1.1)
+        ax.relim()
+        ax.autoscale_view(scalex=False)
+
+    def removeGaussianLines(self):
+        """
+        Removes the fitted gaussians from the top marginal histogram.
+        """
+        for line in self._gauss_lines:
+            line.remove()
+        self._gauss_lines = []
+        self._gauss_key = None
+
+    def clearMarginals(self):
+        """
+        Empties the marginal histograms and removes the gaussian fits.
+        """
+        # Not created yet when the canvas is first refreshed
+        if self._top_fill is None:
+            return
 
-            self.canvas.ax_top.set_xlim(-0.1, 1.1)
+        self.removeGaussianLines()
+
+        for fill in self._top_fill, self._rgt_fill:
+            fill.set_xy(np.empty((0, 2)))
 
     def plotRight(self, corrected, color=None):
         """
-        Plots the top left right marginal histogram (S).
+        Plots the top left right marginal histogram (S). Left empty if there's
+        no stoichiometry (non-ALEX data).
         """
         S = self.S if corrected else self.S_un
-        self.canvas.ax_rgt.set_ylabel("Stoichiometry")
-        self.canvas.ax_rgt.yaxis.set_label_position("right")
-        if S is not None:
-            self.canvas.ax_rgt.clear()
-            self.canvas.ax_rgt.hist(
-                S,
-                bins=self.marg_bins,
-                color=color or gvars.color_purple,
-                alpha=0.8,
-                density=True,
-                histtype="stepfilled",
-                orientation="horizontal",
+        if self.S is None:
+            S = None
+        ax = self.canvas.ax_rgt
+
+        self._rgt_fill.set_facecolor(color or gvars.color_purple)
+        self._rgt_fill.set_xy(
+            lib.plotting.histogram_step_xy(
+                S, bins=self.marg_bins, orientation="horizontal"
             )
+        )
 
         # The stoichiometry histogram is oriented horizontally, meaning the
         # y-axis holds the S values. The limits should therefore be applied to
         # the y-axis instead of the x-axis to avoid clipping the histogram.
-        self.canvas.ax_rgt.set_ylim(-0.1, 1.1)
+        ax.set_ylim(-0.1, 1.1)
+        ax.relim()
+        ax.autoscale_view(scaley=False)
+
+    def getKdeGrid(self, E, S, resolution, corrected):
+        """
+        Returns the grid for the center contour plot, so that it's only
+        rebuilt when the resolution or the data changes.
+        """
+        key = (resolution, corrected)
+        if key not in self._kde_grid_cache:
+            self._kde_grid_cache[key] = lib.math.kde_grid(
+                E, S, resolution=resolution
+            )
+        return self._kde_grid_cache[key]
 
     def plotCenter(self, corrected, params):
         """
@@ -416,48 +572,40 @@ class HistogramWindow(BaseWindow):
             _s_color,
             cmap,
         ) = params
-        self.inspectors[gvars.DensityWindowInspector].setInspectorConfigs(params)
 
-        self.canvas.ax_ctr.clear()
+        ax = self.canvas.ax_ctr
 
-        n_equals_txt = "$N_{{traces}}$ = {}\n$N_{{data}}$ = {}".format(
-            self.n_samples,
-            self.n_points,
-        )
+        self.clearCenter()
 
-        self.canvas.ax_ctr.text(
-            x=0,
-            y=0.9,
-            s=n_equals_txt,
-            color=gvars.color_gui_text,
+        self._ctr_n_text.set_text(
+            "$N_{{traces}}$ = {}\n$N_{{data}}$ = {}".format(
+                self.n_samples, self.n_points
+            )
         )
+        self._ctr_n_text.set_visible(True)
 
         if self.gauss_params is not None:
-            for n, gauss_params in enumerate(self.gauss_params):
-                m, s, w = gauss_params
-                self.canvas.ax_ctr.text(
-                    x=0.6,
-                    y=0.15 - 0.05 * n,
-                    s=r"$\mu_{}$ = {:.2f} $\pm$ {:.2f} ({:.2f})".format(
-                        n + 1, m, s, w
-                    ),
-                    color=gvars.color_gui_text,
-                    zorder=10,
+            for n, (m, s, w) in enumerate(self.gauss_params):
+                self._ctr_gauss_texts.append(
+                    ax.text(
+                        x=0.6,
+                        y=0.15 - 0.05 * n,
+                        s=r"$\mu_{}$ = {:.2f} $\pm$ {:.2f} ({:.2f})".format(
+                            n + 1, m, s, w
+                        ),
+                        color=gvars.color_gui_text,
+                        zorder=10,
+                        animated=True,
+                    )
                 )
 
-        for n, (factor, name) in enumerate(
-            zip(
-                (self.alpha, self.delta, self.beta, self.gamma),
-                ("alpha", "delta", "beta", "gamma"),
-            )
+        for text, factor, name in zip(
+            self._ctr_factor_texts,
+            (self.alpha, self.delta, self.beta, self.gamma),
+            ("alpha", "delta", "beta", "gamma"),
         ):
-            self.canvas.ax_ctr.text(
-                x=0.0,
-                y=0.15 - 0.05 * n,
-                s=r"$\{}$ = {:.2f}".format(name, factor),
-                color=gvars.color_gui_text,
-                zorder=10,
-            )
+            text.set_text(r"$\{}$ = {:.2f}".format(name, factor))
+            text.set_visible(True)
 
         if S is not None:
             if show_density:
@@ -465,23 +613,145 @@ class HistogramWindow(BaseWindow):
                     xdata=E,
                     ydata=S,
                     bandwidth=bandwidth / 200,
-                    resolution=resolution,
                     kernel="linear",
                     n_colors=n_colors,
+                    grid=self.getKdeGrid(E, S, resolution, corrected),
                 )
-                self.canvas.ax_ctr.contourf(*c, cmap=cmap)
+                self._ctr_contour = ax.contourf(*c, cmap=cmap)
+                for collection in self._ctr_contour.collections:
+                    collection.set_animated(True)
 
             if overlay_pts:
                 # Conversion factor, because sliders can't do [0,1]
-                self.canvas.ax_ctr.scatter(
-                    E, S, s=20, color="black", zorder=1, alpha=pts_alpha / 20
+                self._overlay_pts = ax.scatter(
+                    E,
+                    S,
+                    s=20,
+                    color="black",
+                    zorder=1,
+                    alpha=pts_alpha / 20,
+                    animated=True,
                 )
-            self.canvas.ax_ctr.axhline(
-                0.5, color="black", alpha=0.3, lw=0.5, ls="--", zorder=2
+            self._ctr_hline.set_visible(True)
+
+    def clearCenter(self):
+        """
+        Removes the contours, scatter points and gaussian fit texts from the
+        center plot, and hides its persistent texts.
+        """
+        if self._ctr_hline is None:
+            return
+
+        if self._ctr_contour is not None:
+            # ContourSet itself can't be removed from the axes
+            for collection in self._ctr_contour.collections:
+                collection.remove()
+            self._ctr_contour = None
+
+        if self._overlay_pts is not None:
+            self._overlay_pts.remove()
+            self._overlay_pts = None
+
+        for text in self._ctr_gauss_texts:
+            text.remove()
+        self._ctr_gauss_texts = []
+
+        for artist in [self._ctr_n_text, self._ctr_hline]:
+            artist.set_visible(False)
+        for text in self._ctr_factor_texts:
+            text.set_visible(False)
+
+    def _onDraw(self, event):
+        """
+        Caches the background after a full redraw, and draws the (animated)
+        center plot artists on top, which the full redraw skips.
+        """
+        # Animated artists are included when saving the figure
+        if self.canvas.is_saving():
+            return
+
+        self._backgrounds = {
+            ax: self.canvas.copy_from_bbox(ax.bbox) for ax in self.canvas.axes
+        }
+        self._drawAnimated(self.canvas.ax_ctr)
+
+    def _invalidateBackground(self, event):
+        """
+        Drops the cached background, which no longer fits a resized canvas.
+        """
+        self._backgrounds = {}
+
+    def _drawAnimated(self, ax):
+        """
+        Draws all animated artists of an axes, in the same order as a full
+        redraw would.
+        """
+        for artist in sorted(
+            (a for a in ax.get_children() if a.get_animated()),
+            key=lambda a: a.get_zorder(),
+        ):
+            ax.draw_artist(artist)
+
+    def _blitCenter(self):
+        """
+        Redraws the center plot on top of the cached background, and only
+        repaints its area of the canvas. Falls back to a full redraw if there's
+        no background yet.
+        """
+        ax = self.canvas.ax_ctr
+        background = self._backgrounds.get(ax)
+        if background is None:
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(background)
+        self._drawAnimated(ax)
+        self.canvas.blit(ax.bbox)
+
+    def returnDensityInspectorValues(self):
+        """
+        Returns the current DensityWindowInspector values, and saves them to
+        the config so they're restored on next launch. If the inspector hasn't
+        been opened yet, the values are read once from the config instead.
+        """
+        if gvars.DensityWindowInspector in self.inspectors:
+            inspector = self.inspectors[gvars.DensityWindowInspector]
+            params = inspector.returnInspectorValues()
+            # The config file is only written when the values have changed
+            if params != self._density_params:
+                inspector.setInspectorConfigs(params)
+                self._density_params = params
+
+        elif self._density_params is None:
+            (
+                bandwidth,
+                resolution,
+                n_colors,
+                overlay_pts,
+                pts_alpha,
+                show_density,
+                e_color,
+                s_color,
+                cmap,
+            ) = [self.getConfig(key) for key in gvars.keys_hist]
+
+            # Same types as returned by the inspector widgets
+            self._density_params = (
+                int(bandwidth),
+                int(resolution),
+                int(n_colors),
+                bool(overlay_pts),
+                int(pts_alpha),
+                bool(show_density),
+                str(e_color),
+                str(s_color),
+                str(cmap),
             )
 
+        return self._density_params
+
     def plotAll(self, corrected):
-        params = self.inspectors[gvars.DensityWindowInspector].returnInspectorValues()
+        params = self.returnDensityInspectorValues()
         (
             bandwidth,
             resolution,
@@ -493,13 +763,80 @@ class HistogramWindow(BaseWindow):
             s_color,
             cmap,
         ) = params
-        self.plotTop(corrected, color=gvars.plot_color_options.get(e_color, e_color))
+        color_options = gvars.plot_color_options
+        self.plotTop(corrected, color=color_options.get(e_color, e_color))
+        self.plotRight(corrected, color=color_options.get(s_color, s_color))
         if self.S is not None:
             self.plotCenter(corrected, params)
-            self.plotRight(corrected, color=gvars.plot_color_options.get(s_color, s_color))
 
+    def replotTop(self):
+        """
+        Redraws only the top marginal histogram (E), e.g. when the E color is
+        changed in the inspector.
+        """
+        if self.E is None:
+            return
+
+        corrected = self.ui.applyCorrectionsCheckBox.isChecked()
+        e_color = self.returnDensityInspectorValues()[6]
+
+        self.plotTop(
+            corrected, color=gvars.plot_color_options.get(e_color, e_color)
+        )
+        self.plotDefaultElements()
         self.canvas.draw()
 
+    def replotRight(self):
+        """
+        Redraws only the right marginal histogram (S), e.g. when the S color is
+        changed in the inspector.
+        """
+        if self.E is None or self.S is None:
+            return
+
+        corrected = self.ui.applyCorrectionsCheckBox.isChecked()
+        s_color = self.returnDensityInspectorValues()[7]
+
+        self.plotRight(
+            corrected, color=gvars.plot_color_options.get(s_color, s_color)
+        )
+        self.plotDefaultElements()
+        self.canvas.draw()
+
+    def replotCenter(self):
+        """
+        Redraws only the center contour plot, e.g. when the density settings
+        are changed in the inspector.
+        """
+        if self.E is None or self.S is None:
+            return
+
+        corrected = self.ui.applyCorrectionsCheckBox.isChecked()
+        self.plotCenter(corrected, self.returnDensityInspectorValues())
+        self.plotDefaultElements()
+        self._blitCenter()
+
+    def replotOverlay(self):
+        """
+        Updates visibility and alpha of the overlaid points in place. The
+        center plot is only redrawn if the points haven't been plotted yet.
+        """
+        if self.E is None or self.S is None:
+            return
+
+        params = self.returnDensityInspectorValues()
+        overlay_pts, pts_alpha = params[3], params[4]
+
+        if self._overlay_pts is None:
+            if overlay_pts:
+                self.replotCenter()
+            return
+
+        self._overlay_pts.set_visible(overlay_pts)
+        # Conversion factor, because sliders can't do [0,1]
+        self._overlay_pts.set_alpha(pts_alpha / 20)
+        self._blitCenter()
+
     def refreshPlot(self, autofit=False):
         """
         Refreshes plot with currently selected traces. Plot to refresh can be
@@ -508,20 +845,20 @@ class HistogramWindow(BaseWindow):
         corrected = self.ui.applyCorrectionsCheckBox.isChecked()
         try:
             self.getHistogramData()
-            for ax in self.canvas.axes:
-                ax.clear()
+            self.clearCenter()
             if self.E is not None:
                 # Force unchecked
                 if self.S is None:
                     self.ui.applyCorrectionsCheckBox.setChecked(False)
                     corrected = False
-                self.plotDefaultElements()
                 self.plotAll(corrected)
             else:
-                self.plotDefaultElements()
+                self.clearMarginals()
         except (AttributeError, ValueError):
             pass
 
+        # Called once, after plotting, as the center plot limits are reset by
+        # the contours and scatter
         self.plotDefaultElements()
         self.canvas.draw()
 
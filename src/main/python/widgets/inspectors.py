@@ -83,6 +83,13 @@ class DensityWindowInspector(SheetInspector):
         self.ui = Ui_DensityWindowInspector()
         self.ui.setupUi(self)
 
+        # Populated here rather than in the generated Ui file, so that the
+        # items aren't lost (or duplicated on retranslate) when regenerating
+        colors = list(gvars.plot_color_options.keys())
+        self.ui.eColorComboBox.addItems(colors)
+        self.ui.sColorComboBox.addItems(colors)
+        self.ui.cmapComboBox.addItems(gvars.plot_cmap_options)
+
         if self.parent_name == gvars.HistogramWindow:
             self.keys = gvars.keys_hist
             parent.inspector = self
@@ -100,25 +107,51 @@ class DensityWindowInspector(SheetInspector):
         if hasattr(
             parent, "canvas"
         ):  # Avoid refreshing canvas before it's even instantiated on the parent
-            for slider in (
-                self.ui.smoothingSlider,
-                self.ui.resolutionSlider,
-                self.ui.colorSlider,
-                self.ui.pointAlphaSlider,
-            ):
-                if self.parent_name in (
-                    gvars.HistogramWindow,
-                    gvars.TransitionDensityWindow,
+            if self.parent_name == gvars.HistogramWindow:
+                # Each control only redraws the part of the plot it affects
+                for slider in (
+                    self.ui.smoothingSlider,
+                    self.ui.resolutionSlider,
+                    self.ui.colorSlider,
+                ):
+                    slider.valueChanged.connect(parent.replotCenter)
+
+                self.ui.densityCheckBox.clicked.connect(parent.replotCenter)
+                self.ui.cmapComboBox.currentTextChanged.connect(
+                    parent.replotCenter
+                )
+                self.ui.overlayCheckBox.clicked.connect(parent.replotOverlay)
+                self.ui.pointAlphaSlider.valueChanged.connect(
+                    parent.replotOverlay
+                )
+                self.ui.eColorComboBox.currentTextChanged.connect(
+                    parent.replotTop
+                )
+                self.ui.sColorComboBox.currentTextChanged.connect(
+                    parent.replotRight
+                )
+            elif self.parent_name == gvars.TransitionDensityWindow:
+                for slider in (
+                    self.ui.smoothingSlider,
+                    self.ui.resolutionSlider,
+                    self.ui.colorSlider,
+                    self.ui.pointAlphaSlider,
                 ):
                     slider.valueChanged.connect(parent.refreshPlot)
-                else:
-                    raise NotImplementedError
 
-            self.ui.overlayCheckBox.clicked.connect(parent.refreshPlot)
-            self.ui.densityCheckBox.clicked.connect(parent.refreshPlot)
-            self.ui.eColorComboBox.currentTextChanged.connect(parent.refreshPlot)
-            self.ui.sColorComboBox.currentTextChanged.connect(parent.refreshPlot)
-            self.ui.cmapComboBox.currentTextChanged.connect(parent.refreshPlot)
+                self.ui.overlayCheckBox.clicked.connect(parent.refreshPlot)
+                self.ui.densityCheckBox.clicked.connect(parent.refreshPlot)
+                self.ui.eColorComboBox.currentTextChanged.connect(
+                    parent.refreshPlot
+                )
+                self.ui.sColorComboBox.currentTextChanged.connect(
+                    parent.refreshPlot
+                )
+                self.ui.cmapComboBox.currentTextChanged.connect(
+                    parent.refreshPlot
+                )
+            else:
+                raise NotImplementedError
 
     def setUi(self):
         """
@@ -214,7 +247,7 @@ class CorrectionFactorInspector(SheetInspector):
         Sets the global correction factors
         """
         trace_window = self.windows[gvars.TraceWindow]
-        histogram_window = self.windows[gvars.TraceWindow]
+        histogram_window = self.windows[gvars.HistogramWindow]
 
         parent = self.parent
         self.alphaFactor = self.ui.alphaFactorBox.value()
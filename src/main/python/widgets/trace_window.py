@@ -71,8 +71,8 @@ class TraceWindow(BaseWindow):
         item = self.listModel.itemFromIndex(index)  # type: QStandardItem
 
         if self.currName is not None:
-            self.currentTrace().is_checked = (
-                True if item.checkState() == Qt.Checked else False
+            self.data.set_checked(
+                self.currentTrace(), item.checkState() == Qt.Checked
             )
 
         if item.checkState() in (Qt.Checked, Qt.Unchecked):
@@ -666,10 +666,10 @@ class TraceWindow(BaseWindow):
 
             if pass_all:
                 item.setCheckState(Qt.Checked)
-                trace.is_checked = True
+                self.data.set_checked(trace, True)
             else:
                 item.setCheckState(Qt.Unchecked)
-                trace.is_checked = False
+                self.data.set_checked(trace, False)
 
         self.sortListByChecked()
         self.selectListViewTopRow()
@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from lib.container import DataContainer, TraceContainer
+
+
+class TestDataContainer(TestCase):
+    def setUp(self) -> None:
+        self.data = DataContainer()
+        for name in "abcd":
+            self.data.traces[name] = TraceContainer(name=name)
+
+    def test_set_checked(self):
+        trace = self.data.traces["b"]
+
+        self.data.set_checked(trace, True)
+        self.assertTrue(trace.is_checked)
+        self.assertEqual([trace], self.data.get_checked_traces())
+
+        self.data.set_checked(trace, False)
+        self.assertFalse(trace.is_checked)
+        self.assertEqual([], self.data.get_checked_traces())
+
+    def test_get_checked_traces_order(self):
+        # Returned in the order of data.traces, not the order of checking
+        for name in "dbca":
+            self.data.set_checked(self.data.traces[name], True)
+        self.data.set_checked(self.data.traces["b"], False)
+        self.data.set_checked(self.data.traces["b"], True)
+
+        self.assertEqual(
+            list(self.data.traces.values()), self.data.get_checked_traces()
+        )
+
+    def test_get_checked_traces_drops_deleted(self):
+        for trace in self.data.traces.values():
+            self.data.set_checked(trace, True)
+
+        self.data.traces.pop("a")
+        # Replaced by a new, unchecked trace of the same name
+        self.data.traces["c"] = TraceContainer(name="c")
+
+        self.assertEqual(
+            [self.data.traces["b"], self.data.traces["d"]],
+            self.data.get_checked_traces(),
+        )
+        self.assertEqual({"b", "d"}, set(self.data.checked_traces))
+
+        self.data.traces.clear()
+        self.assertEqual([], self.data.get_checked_traces())
@@ -0,0 +1,175 @@
+from unittest import TestCase
+import numpy as np
+
+import lib.math
+
+
+def make_trace(rng, length, bleaches, first_bleach, blink_intervals, alex):
+    """
+    Synthetic background-subtracted trace, as the arguments passed to the
+    histogram calculations by HistogramWindow.getHistogramData
+    """
+    grn_int, acc_int, red_int = rng.uniform(100, 1000, size=(3, length))
+    grn_bg, acc_bg, red_bg = rng.uniform(0, 50, size=(3, length))
+    if not alex:
+        red_int = np.full(length, np.nan)
+
+    intensities = (grn_int, grn_bg, acc_int, acc_bg, red_int, red_bg)
+    return intensities, bleaches, first_bleach, blink_intervals
+
+
+class TestPooledES(TestCase):
+    """
+    Compares the pooled histogram calculations with the per-trace
+    calculations they replace.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        rng = np.random.RandomState(42)
+
+        # first_bleach differs from min(bleaches) for some traces, and blink
+        # intervals include an open interval
+        cls.alex_traces = [
+            make_trace(
+                rng, 60, (40, None, 35), 30, [(5, 10), (20, None)], True
+            ),
+            make_trace(rng, 50, (None, None, None), None, [], True),
+            make_trace(rng, 45, (None, 25, None), 20, [(0, 3)], True),
+        ]
+        cls.non_alex_trace = make_trace(
+            rng, 55, (None, None, None), 50, [(10, 15)], False
+        )
+
+    @staticmethod
+    def per_trace(traces, alpha, delta, max_frames, beta=1, gamma=1):
+        E, S, DD, DA = [], [], [], []
+        for intensities, bleaches, first_bleach, blink_intervals in traces:
+            E_trace, S_trace = lib.math.drop_bleached_frames(
+                intensities=intensities,
+                bleaches=bleaches,
+                alpha=alpha,
+                delta=delta,
+                beta=beta,
+                gamma=gamma,
+                max_frames=max_frames,
+                blink_intervals=blink_intervals,
+            )
+            E.extend(E_trace)
+            S.extend(S_trace)
+
+            _, I_DD, I_DA, _ = lib.math.correct_DA(intensities)
+            end_frame = len(I_DD) if first_bleach is None else first_bleach
+            DD.append(
+                lib.math.exclude_blink_intervals(
+                    I_DD[:end_frame], blink_intervals
+                )
+            )
+            DA.append(
+                lib.math.exclude_blink_intervals(
+                    I_DA[:end_frame], blink_intervals
+                )
+            )
+        E, S = lib.math.trim_ES(E, S)
+        return E, S, np.concatenate(DD), np.concatenate(DA)
+
+    @staticmethod
+    def pooled(traces, alpha, delta, max_frames, beta=1, gamma=1):
+        results = [
+            lib.math.unbleached_intensities(
+                intensities=intensities,
+                bleaches=bleaches,
+                end_frame=first_bleach,
+                max_frames=max_frames,
+                blink_intervals=blink_intervals,
+            )
+            for intensities, bleaches, first_bleach, blink_intervals in traces
+        ]
+        I_DD, I_DA, I_AA, DD, DA = (
+            np.concatenate([r[i] for r in results]) for i in range(5)
+        )
+        has_AA = np.repeat(
+            np.array([r[5] for r in results], dtype=bool),
+            [len(r[0]) for r in results],
+        )
+        E, S = lib.math.pooled_ES(
+            I_DD,
+            I_DA,
+            I_AA,
+            alpha=alpha,
+            delta=delta,
+            beta=beta,
+            gamma=gamma,
+            has_AA=has_AA,
+        )
+        E, S = lib.math.trim_ES(E, S)
+        return E, S, DD, DA
+
+    def assert_same(self, traces, **kwargs):
+        expected = self.per_trace(traces, **kwargs)
+        result = self.pooled(traces, **kwargs)
+        for exp, res in zip(expected, result):
+            np.testing.assert_allclose(res, exp, equal_nan=True)
+
+    def test_alex_traces(self):
+        self.assert_same(
+            self.alex_traces, alpha=0.1, delta=0.05, max_frames=None
+        )
+
+    def test_max_frames(self):
+        self.assert_same(
+            self.alex_traces, alpha=0.1, delta=0.05, max_frames=25
+        )
+
+    def test_beta_gamma(self):
+        self.assert_same(
+            self.alex_traces,
+            alpha=0.1,
+            delta=0.05,
+            max_frames=None,
+            beta=0.8,
+            gamma=1.3,
+        )
+
+    def test_mixed_alex_and_non_alex(self):
+        # Delta must only be applied to the traces with a complete AA channel
+        traces = self.alex_traces + [self.non_alex_trace]
+        self.assert_same(traces, alpha=0.1, delta=0.05, max_frames=None)
+        self.assert_same(traces, alpha=0.1, delta=0.05, max_frames=25)
+
+    def test_has_AA(self):
+        *_, has_AA = lib.math.unbleached_intensities(
+            intensities=self.non_alex_trace[0], bleaches=(None, None, None)
+        )
+        self.assertFalse(has_AA)
+
+
+class TestKdeGrid(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        rng = np.random.RandomState(42)
+        cls.x = rng.uniform(0.2, 0.8, 200)
+        cls.y = rng.uniform(0.3, 0.6, 200)
+
+    def test_kde_grid(self):
+        x, y = lib.math.kde_grid(self.x, self.y, resolution=50)
+        self.assertEqual((50, 50), x.shape)
+        self.assertEqual((50, 50), y.shape)
+
+        # Extended by the mean on both sides
+        xmean, ymean = np.mean(self.x), np.mean(self.y)
+        self.assertAlmostEqual(np.min(self.x) - xmean, x[0, 0])
+        self.assertAlmostEqual(np.max(self.x) + xmean, x[-1, 0])
+        self.assertAlmostEqual(np.min(self.y) - ymean, y[0, 0])
+        self.assertAlmostEqual(np.max(self.y) + ymean, y[0, -1])
+
+    def test_kde_grid_diagonal(self):
+        x, y = lib.math.kde_grid(self.x, self.y, resolution=50, diagonal=True)
+        np.testing.assert_array_equal(x[:, 0], y[0, :])
+
+    def test_contour_2d_precomputed_grid(self):
+        grid = lib.math.kde_grid(self.x, self.y, resolution=30)
+        expected = lib.math.contour_2d(self.x, self.y, resolution=30)
+        result = lib.math.contour_2d(self.x, self.y, grid=grid)
+        for exp, res in zip(expected, result):
+            np.testing.assert_allclose(res, exp)
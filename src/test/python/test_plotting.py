@@ -0,0 +1,36 @@
+from unittest import TestCase
+import numpy as np
+
+import lib.plotting
+
+
+class TestHistogramStepXY(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.data = np.random.RandomState(42).normal(0.5, 0.1, 500)
+        cls.bins = np.arange(-0.1, 1.1, 0.02)
+
+    def test_histogram_step_xy(self):
+        xy = lib.plotting.histogram_step_xy(self.data, bins=self.bins)
+        counts, edges = np.histogram(self.data, bins=self.bins, density=True)
+
+        self.assertEqual((2 * len(edges), 2), xy.shape)
+        np.testing.assert_array_equal(np.repeat(edges, 2), xy[:, 0])
+
+        # Closed at zero on both ends, with a flat step per bin
+        self.assertEqual(0, xy[0, 1])
+        self.assertEqual(0, xy[-1, 1])
+        np.testing.assert_array_equal(counts, xy[1:-1:2, 1])
+        np.testing.assert_array_equal(counts, xy[2:-1:2, 1])
+
+    def test_histogram_step_xy_horizontal(self):
+        vertical = lib.plotting.histogram_step_xy(self.data, bins=self.bins)
+        horizontal = lib.plotting.histogram_step_xy(
+            self.data, bins=self.bins, orientation="horizontal"
+        )
+        np.testing.assert_array_equal(vertical[:, ::-1], horizontal)
+
+    def test_histogram_step_xy_empty(self):
+        for data in None, np.array([]):
+            xy = lib.plotting.histogram_step_xy(data, bins=self.bins)
+            self.assertEqual((0, 2), xy.shape)